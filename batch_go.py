@@ -0,0 +1,234 @@
+'''
+Vectorized rules engine for many boards of the Go game in go_player.py.
+
+All boards live in one NumPy array and every rule (placement, capture,
+legality including suicide and KO, scoring with komi) is applied to all of
+them at once, so random or policy playouts and self-play run without a
+Python loop per board. The rules follow GO.play: a game ends after max_move
+moves and the winner is decided by GO.judge_winner.
+
+Moves are indices row * n + column, with n * n meaning PASS.
+'''
+import numpy as np
+
+def detectNeighbor(mask):
+    '''
+    Mark the points next to any marked point.
+
+    :param mask: boolean array of shape (..., n, n).
+    :return: boolean array of the same shape.
+    '''
+    neighbors = np.zeros_like(mask)
+    neighbors[..., 1:, :] |= mask[..., :-1, :]
+    neighbors[..., :-1, :] |= mask[..., 1:, :]
+    neighbors[..., :, 1:] |= mask[..., :, :-1]
+    neighbors[..., :, :-1] |= mask[..., :, 1:]
+    return neighbors
+
+def findDiedPieces(boards, piece_types):
+    '''
+    Find the stones of a given piece type that have no liberty.
+
+    :param boards: int8 array of shape (num_boards, n, n).
+    :param piece_types: array of shape (num_boards,), 1('X') or 2('O') for each board.
+    :return: boolean array of shape (num_boards, n, n) marking the dead stones.
+    '''
+    stones = boards == piece_types[:, None, None]
+    # Grow the groups touching an empty point until no more stones join them
+    alive = stones & detectNeighbor(boards == 0)
+    while True:
+        grown = alive | (stones & detectNeighbor(alive))
+        if np.array_equal(grown, alive):
+            break
+        alive = grown
+    return stones & ~alive
+
+class BatchGO:
+    def __init__(self, num_boards, n=5):
+        '''
+        Many Go games played in lockstep.
+
+        :param num_boards: number of boards.
+        :param n: size of the board n*n
+        '''
+        self.num_boards = num_boards
+        self.size = n
+        self.pass_move = n * n
+        self.max_move = n * n - 1 # The max movement of a Go game
+        self.komi = n/2 # Komi rule
+        self.init_board()
+
+    def init_board(self):
+        '''
+        Reset every board to an empty board with X to play.
+
+        :return: None.
+        '''
+        shape = (self.num_boards, self.size, self.size)
+        self.board = np.zeros(shape, dtype=np.int8)
+        self.previous_board = np.zeros(shape, dtype=np.int8)
+        self.X_move = np.ones(self.num_boards, dtype=bool)
+        self.died_pieces = np.zeros(self.num_boards, dtype=bool) # Whether the last move captured stones of the player to move
+        self.n_move = np.zeros(self.num_boards, dtype=np.int32)
+        self.done = np.zeros(self.num_boards, dtype=bool)
+
+    def set_board(self, piece_type, previous_board, board):
+        '''
+        Initialize board status, like GO.set_board for every board.
+
+        :param piece_type: array of shape (num_boards,), the player to move on each board.
+        :param previous_board: array of shape (num_boards, n, n), previous board states.
+        :param board: array of shape (num_boards, n, n), current board states.
+        :return: None.
+        '''
+        piece_type = np.asarray(piece_type)
+        self.previous_board = np.array(previous_board, dtype=np.int8)
+        self.board = np.array(board, dtype=np.int8)
+        self.X_move = piece_type == 1
+        mover_before = self.previous_board == piece_type[:, None, None]
+        self.died_pieces = (mover_before & (self.board != piece_type[:, None, None])).any(axis=(1, 2))
+
+    def piece_type(self):
+        '''
+        :return: array of shape (num_boards,) with the player to move on each board.
+        '''
+        return np.where(self.X_move, 1, 2).astype(np.int8)
+
+    def legal_moves(self):
+        '''
+        Check every move on every board, like GO.valid_place_check.
+
+        :return: boolean array of shape (num_boards, n * n + 1), PASS is always legal.
+        '''
+        num_boards = self.num_boards
+        n = self.size
+        num_points = n * n
+        piece_type = self.piece_type()
+        points = np.arange(num_points)
+
+        # One candidate board for every point of every board
+        candidates = np.repeat(self.board[:, None], num_points, axis=1)
+        candidates[:, points, points // n, points % n] = piece_type[:, None]
+        candidates = candidates.reshape(num_boards * num_points, n, n)
+        own = np.repeat(piece_type, num_points)
+        candidates[findDiedPieces(candidates, 3 - own)] = 0
+
+        # Suicide: the placed stone still has no liberty after the captures
+        own_died = findDiedPieces(candidates, own).reshape(num_boards, num_points, num_points)
+        suicide = own_died[:, points, points]
+
+        # KO: the placement repeats the previous board right after a capture
+        candidates = candidates.reshape(num_boards, num_points, num_points)
+        repeat = (candidates == self.previous_board.reshape(num_boards, 1, num_points)).all(axis=2)
+        ko = repeat & self.died_pieces[:, None]
+
+        legal = np.ones((num_boards, num_points + 1), dtype=bool)
+        legal[:, :num_points] = (self.board.reshape(num_boards, num_points) == 0) & ~suicide & ~ko
+        legal[self.done, :num_points] = False
+        return legal
+
+    def apply_moves(self, moves):
+        '''
+        Play one move on every board that is not finished, like one turn of GO.play.
+        The moves are assumed to be legal.
+
+        :param moves: int array of shape (num_boards,).
+        :return: None.
+        '''
+        n = self.size
+        moves = np.asarray(moves)
+        piece_type = self.piece_type()
+        active = ~self.done
+        place = active & (moves != self.pass_move)
+
+        board = self.board.copy()
+        indices = np.nonzero(place)[0]
+        board[indices, moves[indices] // n, moves[indices] % n] = piece_type[indices]
+        died = findDiedPieces(board, 3 - piece_type) & place[:, None, None]
+        board[died] = 0
+
+        # A placement remembers the board before it, a PASS copies the current board
+        self.previous_board[place] = self.board[place]
+        passed = active & ~place
+        self.previous_board[passed] = board[passed]
+        self.died_pieces[place] = died[place].any(axis=(1, 2))
+        self.board = board
+
+        self.n_move[active] += 1
+        self.X_move[active] = ~self.X_move[active]
+        self.done |= self.n_move >= self.max_move
+
+    def score(self, piece_type):
+        '''
+        Get score of a player on every board by counting the number of stones.
+
+        :param piece_type: 1('X') or 2('O').
+        :return: int array of shape (num_boards,).
+        '''
+        return (self.board == piece_type).sum(axis=(1, 2))
+
+    def judge_winner(self):
+        '''
+        Judge the winner of every game by number of pieces for each player.
+
+        :return: int array of shape (num_boards,), piece type of the winner (0 if it's a tie).
+        '''
+        cnt_1 = self.score(1)
+        cnt_2 = self.score(2) + self.komi
+        return np.where(cnt_1 > cnt_2, 1, np.where(cnt_1 < cnt_2, 2, 0)).astype(np.int8)
+
+    def play(self, policy, history=None):
+        '''
+        Play every game to the end.
+
+        :param policy: callable taking (BatchGO, legal move mask) and returning the moves to play.
+        :param history: optional list receiving (board, piece type, moves) arrays for every turn.
+        :return: piece type of the winner of every game (0 if it's a tie).
+        '''
+        while not self.done.all():
+            legal = self.legal_moves()
+            moves = policy(self, legal)
+            if history is not None:
+                history.append((self.board.copy(), self.piece_type(), np.array(moves)))
+            self.apply_moves(moves)
+        return self.judge_winner()
+
+def randomPolicy(rng=None):
+    '''
+    Policy picking a random valid placement, and PASS only when there is none.
+
+    :param rng: numpy Generator, a new one is created if None.
+    :return: policy callable for BatchGO.play.
+    '''
+    if rng is None:
+        rng = np.random.default_rng()
+
+    def policy(batch_go, legal):
+        placements = legal[:, :-1]
+        noise = rng.random(placements.shape)
+        noise[~placements] = -1
+        moves = noise.argmax(axis=1)
+        moves[~placements.any(axis=1)] = batch_go.pass_move
+        return moves
+    return policy
+
+def randomPlayouts(num_games, n=5, seed=None):
+    '''
+    Play random games from the empty board.
+
+    :param num_games: number of games.
+    :param n: size of the board n*n.
+    :param seed: random seed.
+    :return: piece type of the winner of every game (0 if it's a tie).
+    '''
+    batch_go = BatchGO(num_games, n)
+    return batch_go.play(randomPolicy(np.random.default_rng(seed)))
+
+if __name__ == "__main__":
+    import time
+    num_games = 4096
+    start = time.time()
+    winners = randomPlayouts(num_games, seed=0)
+    elapsed = time.time() - start
+    print(f'{num_games} random games in {elapsed:.2f}s ({num_games / elapsed:.0f} games/s)')
+    print(f'X wins {(winners == 1).mean():.3f}, O wins {(winners == 2).mean():.3f}, ties {(winners == 0).mean():.3f}')
@@ -0,0 +1,74 @@
+'''
+Measure the cold start of the per-move process of my_player3.py.
+
+Each run starts a new process the way the referee does and reports the
+interpreter startup alone, the import of go_player and the time until the
+search starts (STARTUP_PROBE makes the player exit there).
+Every millisecond before the first node is taken from the search.
+
+Usage: python bench_startup.py [--runs N]
+'''
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from go_player import writePlayerState
+
+PLAYER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "my_player3.py")
+
+# A middle game position, X to play, out of the opening book
+INPUT = '''1
+00000
+01200
+02100
+00100
+00000
+00000
+01200
+02100
+00120
+00000
+'''
+
+def timeProcess(args, cwd, env=None):
+    '''
+    :return: tuple of the process start time in milliseconds, its output and its end time in milliseconds.
+    '''
+    start = time.time() * 1000
+    result = subprocess.run(args, cwd=cwd, env=env, capture_output=True, text=True, check=True)
+    return start, result.stdout, time.time() * 1000
+
+def measure(runs):
+    '''
+    :param runs: number of processes started for each measure.
+    :return: dict of measure name -> list of times in milliseconds.
+    '''
+    timings = {'interpreter': [], 'import': [], 'first node': []}
+    env = dict(os.environ, STARTUP_PROBE='1')
+    import_code = f'import sys; sys.path.insert(0, {os.path.dirname(PLAYER_PATH)!r}); import go_player'
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, 'input.txt'), 'w') as f:
+            f.write(INPUT)
+        for run in range(runs):
+            # Every run restores the state of the previous move, like a real game
+            writePlayerState(5, 6, {}, os.path.join(directory, 'player_state.bin'))
+
+            start, output, end = timeProcess([sys.executable, '-c', 'pass'], directory)
+            timings['interpreter'].append(end - start)
+            start, output, end = timeProcess([sys.executable, '-c', import_code], directory)
+            timings['import'].append(end - start)
+            start, output, end = timeProcess([sys.executable, PLAYER_PATH], directory, env)
+            first_node_time = [line for line in output.splitlines() if line.startswith('first_node_time:')]
+            timings['first node'].append(float(first_node_time[0].split()[1]) - start)
+    return timings
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Measure the time to first search node of my_player3.py.')
+    parser.add_argument('--runs', type=int, default=20, help='number of processes started for each measure')
+    args = parser.parse_args()
+    for name, times in measure(args.runs).items():
+        print(f'{name:>12}: median {statistics.median(times):6.1f} ms, min {min(times):6.1f} ms')
@@ -0,0 +1,120 @@
+'''
+Build the opening book read by my_player3.py.
+
+Every position reachable from the empty board in fewer than K moves is
+canonicalized by symmetry, searched offline with a long time budget and
+written as a sorted array of 64-bit entries, so that the player can answer
+opening moves with a binary search over the memory-mapped file.
+
+Usage: python build_opening_book.py [--depth K] [--time MILLI] [--output PATH]
+'''
+import argparse
+
+from go_player import GO, MyPlayer, canonicalizeBoard, transformPoint, getTimeNowInMilli
+from go_player import OPENING_BOOK_PATH, OPENING_BOOK_MAGIC, OPENING_BOOK_HEADER, OPENING_BOOK_ENTRY
+
+def enumeratePositions(n, depth):
+    '''
+    Enumerate the canonical positions reachable from the empty board in fewer than depth moves.
+
+    :param n: size of the board n*n.
+    :param depth: number of moves covered by the book.
+    :return: dict mapping book key to (board, piece_type, symmetry).
+    '''
+    empty_board = [[0 for x in range(n)] for y in range(n)]
+    frontier = [empty_board]
+    positions = {}
+    for ply in range(depth):
+        piece_type = 1 if ply % 2 == 0 else 2
+        next_frontier = []
+        for board in frontier:
+            code, symmetry = canonicalizeBoard(board, n)
+            key = code * 4 + piece_type
+            if key in positions:
+                continue
+            positions[key] = (board, piece_type, symmetry)
+            if ply == depth - 1:
+                continue
+            go = GO(n)
+            go.set_board(piece_type, board, board)
+            for i in range(n):
+                for j in range(n):
+                    if not go.valid_place_check(i, j, piece_type, test_check=True):
+                        continue
+                    go_with_placement = go.copy_board()
+                    go_with_placement.board[i][j] = piece_type
+                    go_with_placement.remove_died_pieces(3 - piece_type)
+                    next_frontier.append(go_with_placement.board)
+        frontier = next_frontier
+    return positions
+
+def searchPosition(player, board, piece_type, time_limit):
+    '''
+    Search the best placement of one book position.
+
+    :param player: MyPlayer instance.
+    :param board: board state.
+    :param piece_type: 1('X') or 2('O').
+    :param time_limit: time budget in milliseconds for the whole position.
+    :return: (row, column) of the best placement, or None if there is no valid placement.
+    '''
+    n = len(board)
+    go = GO(n)
+    go.set_board(piece_type, board, board)
+    possible_placements, tuple_stone = player.find_possible_placements_and_number_of_blank(go, piece_type)
+    if not possible_placements:
+        return None
+    num_turn = tuple_stone[1] + tuple_stone[2]
+    max_depth = (n ** 2) - num_turn - 2
+    best_placement, max_heuristic, best_move_path = player.search_placements(go, piece_type, possible_placements, max_depth, getTimeNowInMilli() + time_limit)
+    return best_placement
+
+def writeOpeningBook(entries, n, max_stones, path=OPENING_BOOK_PATH):
+    '''
+    Write the opening book as a header followed by the sorted entries.
+
+    :param entries: dict mapping book key to canonical move index.
+    :param n: size of the board n*n.
+    :param max_stones: largest number of stones of a book position.
+    :param path: output file.
+    :return: None.
+    '''
+    with open(path, 'wb') as f:
+        f.write(OPENING_BOOK_HEADER.pack(OPENING_BOOK_MAGIC, n, max_stones, len(entries)))
+        for key in sorted(entries):
+            f.write(OPENING_BOOK_ENTRY.pack((key << 8) | entries[key]))
+
+def buildOpeningBook(n, depth, time_limit, path=OPENING_BOOK_PATH):
+    '''
+    Search every book position and write the book file.
+
+    :param n: size of the board n*n.
+    :param depth: number of moves covered by the book.
+    :param time_limit: time budget in milliseconds for each position.
+    :param path: output file.
+    :return: number of entries written.
+    '''
+    positions = enumeratePositions(n, depth)
+    print(f'{len(positions)} positions to search')
+    player = MyPlayer()
+    entries = {}
+    start = getTimeNowInMilli()
+    for index, (key, (board, piece_type, symmetry)) in enumerate(positions.items()):
+        placement = searchPosition(player, board, piece_type, time_limit)
+        if placement is None:
+            continue
+        canonical_move = transformPoint(placement[0], placement[1], n, symmetry)
+        entries[key] = canonical_move[0] * n + canonical_move[1]
+        print(f'[{index + 1}/{len(positions)}] piece {piece_type} -> {placement} ({(getTimeNowInMilli() - start) / 1000:.1f}s)')
+    writeOpeningBook(entries, n, depth - 1, path)
+    return len(entries)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Build the opening book for my_player3.py.')
+    parser.add_argument('--size', type=int, default=5, help='size of the board')
+    parser.add_argument('--depth', type=int, default=3, help='number of moves covered by the book')
+    parser.add_argument('--time', type=int, default=30000, help='search time in milliseconds for each position')
+    parser.add_argument('--output', default=OPENING_BOOK_PATH, help='book file to write')
+    args = parser.parse_args()
+    num_entries = buildOpeningBook(args.size, args.depth, args.time, args.output)
+    print(f'wrote {num_entries} entries to {args.output}')
@@ -0,0 +1,86 @@
+'''
+Check that BatchGO follows the same rules as GO.
+
+Random games, with some passes, are played in lockstep on a BatchGO and on
+one GO per board. After every turn, the legal move masks, boards, previous
+boards and capture flags must match, and at the end so must the winners.
+Run it after changing either engine.
+
+Usage: python check_batch_go.py [--games N] [--seed S]
+'''
+import argparse
+import sys
+
+import numpy as np
+
+from batch_go import BatchGO, randomPolicy
+from go_player import GO
+
+def checkLockstep(num_games, seed, pass_rate=0.05):
+    '''
+    :param num_games: number of games played.
+    :param seed: random seed.
+    :param pass_rate: probability of passing instead of the policy move.
+    :return: list of mismatch descriptions, empty if the engines agree.
+    '''
+    n = 5
+    rng = np.random.default_rng(seed)
+    policy = randomPolicy(rng)
+    batch_go = BatchGO(num_games, n)
+    list_go = [GO(n) for game in range(num_games)]
+    for go in list_go:
+        go.init_board(n)
+
+    mismatches = []
+    while not batch_go.done.all():
+        legal = batch_go.legal_moves()
+        for index, go in enumerate(list_go):
+            if batch_go.done[index]:
+                continue
+            piece_type = 1 if go.X_move else 2
+            expected = [go.valid_place_check(i, j, piece_type, test_check=True) for i in range(n) for j in range(n)]
+            if list(legal[index, :n * n]) != expected:
+                mismatches.append(f'game {index} move {go.n_move}: legal moves differ')
+
+        moves = policy(batch_go, legal)
+        moves[rng.random(num_games) < pass_rate] = batch_go.pass_move
+        # Same turn as GO.play
+        for index, go in enumerate(list_go):
+            if batch_go.done[index]:
+                continue
+            piece_type = 1 if go.X_move else 2
+            move = moves[index]
+            if move != batch_go.pass_move:
+                go.place_chess(move // n, move % n, piece_type)
+                go.died_pieces = go.remove_died_pieces(3 - piece_type)
+            else:
+                go.previous_board = [row[:] for row in go.board]
+            go.n_move += 1
+            go.X_move = not go.X_move
+        batch_go.apply_moves(moves)
+
+        for index, go in enumerate(list_go):
+            if not np.array_equal(np.array(go.board), batch_go.board[index]):
+                mismatches.append(f'game {index} move {go.n_move}: boards differ')
+            if not np.array_equal(np.array(go.previous_board), batch_go.previous_board[index]):
+                mismatches.append(f'game {index} move {go.n_move}: previous boards differ')
+            if bool(go.died_pieces) != batch_go.died_pieces[index]:
+                mismatches.append(f'game {index} move {go.n_move}: capture flags differ')
+
+    for index, (go, winner) in enumerate(zip(list_go, batch_go.judge_winner())):
+        if go.judge_winner() != winner:
+            mismatches.append(f'game {index}: winners differ')
+    return mismatches
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Check BatchGO against GO on random games.')
+    parser.add_argument('--games', type=int, default=300, help='number of games')
+    parser.add_argument('--seed', type=int, default=1, help='random seed')
+    args = parser.parse_args()
+    mismatches = checkLockstep(args.games, args.seed)
+    for mismatch in mismatches[:20]:
+        print(mismatch)
+    if mismatches:
+        print(f'{len(mismatches)} mismatches')
+        sys.exit(1)
+    print(f'{args.games} games: BatchGO matches GO')
@@ -0,0 +1,1272 @@
+# The player, run for every move by the my_player3.py launcher. Every move starts a new process,
+# so only modules that load in microseconds are imported here.
+import mmap
+import os
+import struct
+import time
+MAX_INT_IN_THIS_PROGRAM = 1000000000
+MIN_INT_IN_THIS_PROGRAM = -1000000000
+MAX_TIME_FOR_EACH_MOVE_IN_MILLI = 9000
+# The search stops starting new work at the soft deadline, the watchdog ends the process at the hard one
+SEARCH_SAFETY_MARGIN_IN_MILLI = 500
+WATCHDOG_SAFETY_MARGIN_IN_MILLI = 150
+
+# Weights of MyPlayer.calculate_heuristic, tuned by tune_heuristic.py
+HEURISTIC_WEIGHT_NAMES = (
+    'stone_difference',
+    'my_group_small', 'my_group_medium', 'my_group_large',
+    'my_liberty_1', 'my_liberty_2', 'my_liberty_3',
+    'opponent_group_small', 'opponent_group_medium', 'opponent_group_large',
+    'opponent_liberty_1', 'opponent_liberty_2', 'opponent_liberty_3',
+    'center_distance',
+)
+DEFAULT_HEURISTIC_WEIGHTS = {
+    'stone_difference': 100000,
+    'my_group_small': 10, # factor of groups of 1 stone
+    'my_group_medium': 30, # factor of groups of 2 to 3 stones
+    'my_group_large': 100, # factor of groups of 4 stones or more
+    'my_liberty_1': -3000, # for each stone of a group in atari
+    'my_liberty_2': -300,
+    'my_liberty_3': -100,
+    'opponent_group_small': 100,
+    'opponent_group_medium': 500,
+    'opponent_group_large': 2000,
+    'opponent_liberty_1': 2500,
+    'opponent_liberty_2': 800,
+    'opponent_liberty_3': 250,
+    'center_distance': 10000,
+}
+
+# Opening book: a header followed by sorted 64-bit entries (key << 8 | move index)
+# where key = canonical board code * 4 + piece type. See build_opening_book.py.
+OPENING_BOOK_PATH = "opening_book.bin"
+OPENING_BOOK_MAGIC = b'GOBK'
+OPENING_BOOK_HEADER = struct.Struct('<4sBBI') # magic, board size, max stones, number of entries
+OPENING_BOOK_ENTRY = struct.Struct('<Q')
+
+# Search trace: a header followed by one fixed size record per finished node. See read_search_trace.py.
+SEARCH_TRACE_MAGIC = b'GOTR'
+SEARCH_TRACE_HEADER = struct.Struct('<4sB') # magic, board size
+SEARCH_TRACE_RECORD = struct.Struct('<QBbiiiBB') # board code, ply, depth, alpha, beta, heuristic, best move index, flag
+SEARCH_TRACE_CUTOFF = 1 # flag of a node cut off by alpha-beta
+SEARCH_TRACE_ABORTED = 2 # flag of a node finished after the deadline, its value is not a full search
+SEARCH_TRACE_NO_MOVE = 255
+SEARCH_TRACE_NEW_SEARCH = 255 # ply of the record written when a new search starts
+
+# Cross-move state: a header and our best moves along the principal variation of the last search,
+# keyed by board code, so the next move can try them first. See MyPlayer.restore_state.
+PLAYER_STATE_PATH = "player_state.bin"
+PLAYER_STATE_MAGIC = b'GOST'
+PLAYER_STATE_HEADER = struct.Struct('<4sBBB') # magic, board size, turn, number of entries
+PLAYER_STATE_ENTRY = struct.Struct('<QbB') # board code, depth left on the pv, best move index
+
+# Tables depending only on the board size, built on first use
+NEIGHBOR_TABLES = {}
+SYMMETRY_POWER_TABLES = {}
+
+def getTimeNowInMilli():
+    return int(time.time() * 1000)
+
+START_TIME = getTimeNowInMilli()
+
+class GO:
+    def __init__(self, n):
+        """
+        Go game.
+
+        :param n: size of the board n*n
+        """
+        self.size = n
+        #self.previous_board = None # Store the previous board
+        self.X_move = True # X chess plays first
+        self.died_pieces = [] # Intialize died pieces to be empty
+        self.n_move = 0 # Trace the number of moves
+        self.max_move = n * n - 1 # The max movement of a Go game
+        self.komi = n/2 # Komi rule
+        self.verbose = False # Verbose only when there is a manual player
+        self.neighbors = getNeighborTable(n)
+
+    def init_board(self, n):
+        '''
+        Initialize a board with size n*n.
+
+        :param n: width and height of the board.
+        :return: None.
+        '''
+        board = [[0 for x in range(n)] for y in range(n)]  # Empty space marked as 0
+        # 'X' pieces marked as 1
+        # 'O' pieces marked as 2
+        self.board = board
+        self.previous_board = [row[:] for row in board]
+
+    def set_board(self, piece_type, previous_board, board):
+        '''
+        Initialize board status.
+        :param previous_board: previous board state.
+        :param board: current board state.
+        :return: None.
+        '''
+
+        # 'X' pieces marked as 1
+        # 'O' pieces marked as 2
+
+        for i in range(self.size):
+            for j in range(self.size):
+                if previous_board[i][j] == piece_type and board[i][j] != piece_type:
+                    self.died_pieces.append((i, j))
+
+        # self.piece_type = piece_type
+        self.previous_board = previous_board
+        self.board = board
+
+    def compare_board(self, board1, board2):
+        for i in range(self.size):
+            for j in range(self.size):
+                if board1[i][j] != board2[i][j]:
+                    return False
+        return True
+
+    def copy_board(self):
+        '''
+        Copy the current board for potential testing.
+
+        :param: None.
+        :return: the copied board instance.
+        '''
+        go = GO(self.size)
+        go.X_move = self.X_move
+        go.died_pieces = self.died_pieces[:]
+        go.n_move = self.n_move
+        go.verbose = self.verbose
+        go.previous_board = [row[:] for row in self.previous_board]
+        go.board = [row[:] for row in self.board]
+        return go
+
+    def detect_neighbor(self, i, j):
+        '''
+        Detect all the neighbors of a given stone.
+
+        :param i: row number of the board.
+        :param j: column number of the board.
+        :return: a list containing the neighbors row and column (row, column) of position (i, j).
+        '''
+        # Neighbors inside the borders are precomputed for every point
+        return self.neighbors[i][j]
+
+    def detect_neighbor_ally(self, i, j):
+        '''
+        Detect the neighbor allies of a given stone.
+
+        :param i: row number of the board.
+        :param j: column number of the board.
+        :return: a list containing the neighbored allies row and column (row, column) of position (i, j).
+        '''
+        board = self.board
+        neighbors = self.detect_neighbor(i, j)  # Detect neighbors
+        group_allies = []
+        # Iterate through neighbors
+        for piece in neighbors:
+            # Add to allies list if having the same color
+            if board[piece[0]][piece[1]] == board[i][j]:
+                group_allies.append(piece)
+        return group_allies
+
+    def ally_dfs(self, i, j):
+        '''
+        Using DFS to search for all allies of a given stone.
+
+        :param i: row number of the board.
+        :param j: column number of the board.
+        :return: a list containing the all allies row and column (row, column) of position (i, j).
+        '''
+        stack = [(i, j)]  # stack for DFS serach
+        ally_members = []  # record allies positions during the search
+        while stack:
+            piece = stack.pop()
+            ally_members.append(piece)
+            neighbor_allies = self.detect_neighbor_ally(piece[0], piece[1])
+            for ally in neighbor_allies:
+                if ally not in stack and ally not in ally_members:
+                    stack.append(ally)
+        return ally_members
+
+    def find_liberty(self, i, j):
+        '''
+        Find liberty of a given stone. If a group of allied stones has no liberty, they all die.
+
+        :param i: row number of the board.
+        :param j: column number of the board.
+        :return: boolean indicating whether the given stone still has liberty.
+        '''
+        board = self.board
+        ally_members = self.ally_dfs(i, j)
+        for member in ally_members:
+            neighbors = self.detect_neighbor(member[0], member[1])
+            for piece in neighbors:
+                # If there is empty space around a piece, it has liberty
+                if board[piece[0]][piece[1]] == 0:
+                    return True
+        # If none of the pieces in a allied group has an empty space, it has no liberty
+        return False
+
+    def find_num_liberty_and_ally_member(self, i, j):
+        '''
+        Find number of liberty of a given stone as well as list of ally member. If a group of allied stones has no liberty, they all die.
+
+        :param i: row number of the board.
+        :param j: column number of the board.
+        :return: tuple list of ally member and number of liberty.
+        '''
+        num_of_liberty = 0
+        board = self.board
+        list_check_repect_point = []
+        ally_members = self.ally_dfs(i, j)
+        for member in ally_members:
+            neighbors = self.detect_neighbor(member[0], member[1])
+            for piece in neighbors:
+                # If there is empty space around a piece, it has liberty
+                if board[piece[0]][piece[1]] == 0:
+                    if ((piece[0], piece[1]) not in list_check_repect_point):
+                        num_of_liberty += 1
+                        list_check_repect_point.append((piece[0], piece[1]))
+        # If none of the pieces in a allied group has an empty space, it has no liberty
+        return (ally_members, num_of_liberty)
+
+    def find_died_pieces(self, piece_type):
+        '''
+        Find the died stones that has no liberty in the board for a given piece type.
+
+        :param piece_type: 1('X') or 2('O').
+        :return: a list containing the dead pieces row and column(row, column).
+        '''
+        board = self.board
+        died_pieces = []
+
+        for i in range(len(board)):
+            for j in range(len(board)):
+                # Check if there is a piece at this position:
+                if board[i][j] == piece_type:
+                    # The piece die if it has no liberty
+                    if not self.find_liberty(i, j):
+                        died_pieces.append((i,j))
+        return died_pieces
+
+    def remove_died_pieces(self, piece_type):
+        '''
+        Remove the dead stones in the board.
+
+        :param piece_type: 1('X') or 2('O').
+        :return: locations of dead pieces.
+        '''
+
+        died_pieces = self.find_died_pieces(piece_type)
+        if not died_pieces: return []
+        self.remove_certain_pieces(died_pieces)
+        return died_pieces
+
+    def remove_certain_pieces(self, positions):
+        '''
+        Remove the stones of certain locations.
+
+        :param positions: a list containing the pieces to be removed row and column(row, column)
+        :return: None.
+        '''
+        board = self.board
+        for piece in positions:
+            board[piece[0]][piece[1]] = 0
+        self.update_board(board)
+
+    def place_chess(self, i, j, piece_type):
+        '''
+        Place a chess stone in the board.
+
+        :param i: row number of the board.
+        :param j: column number of the board.
+        :param piece_type: 1('X') or 2('O').
+        :return: boolean indicating whether the placement is valid.
+        '''
+        board = self.board
+
+        valid_place = self.valid_place_check(i, j, piece_type)
+        if not valid_place:
+            return False
+        self.previous_board = [row[:] for row in board]
+        board[i][j] = piece_type
+        self.update_board(board)
+        # Remove the following line for HW2 CS561 S2020
+        # self.n_move += 1
+        return True
+
+    def valid_place_check(self, i, j, piece_type, test_check=False):
+        '''
+        Check whether a placement is valid.
+
+        :param i: row number of the board.
+        :param j: column number of the board.
+        :param piece_type: 1(white piece) or 2(black piece).
+        :param test_check: boolean if it's a test check.
+        :return: boolean indicating whether the placement is valid.
+        '''   
+        board = self.board
+        verbose = self.verbose
+        if test_check:
+            verbose = False
+
+        # Check if the place is in the board range
+        if not (i >= 0 and i < len(board)):
+            if verbose:
+                print(('Invalid placement. row should be in the range 1 to {}.').format(len(board) - 1))
+            return False
+        if not (j >= 0 and j < len(board)):
+            if verbose:
+                print(('Invalid placement. column should be in the range 1 to {}.').format(len(board) - 1))
+            return False
+        
+        # Check if the place already has a piece
+        if board[i][j] != 0:
+            if verbose:
+                print('Invalid placement. There is already a chess in this position.')
+            return False
+        
+        # Copy the board for testing
+        test_go = self.copy_board()
+        test_board = test_go.board
+
+        # Check if the place has liberty
+        test_board[i][j] = piece_type
+        test_go.update_board(test_board)
+        if test_go.find_liberty(i, j):
+            return True
+
+        # If not, remove the died pieces of opponent and check again
+        test_go.remove_died_pieces(3 - piece_type)
+        if not test_go.find_liberty(i, j):
+            if verbose:
+                print('Invalid placement. No liberty found in this position.')
+            return False
+
+        # Check special case: repeat placement causing the repeat board state (KO rule)
+        else:
+            if self.died_pieces and self.compare_board(self.previous_board, test_go.board):
+                if verbose:
+                    print('Invalid placement. A repeat move not permitted by the KO rule.')
+                return False
+        return True
+        
+    def update_board(self, new_board):
+        '''
+        Update the board with new_board
+
+        :param new_board: new board.
+        :return: None.
+        '''   
+        self.board = new_board
+
+    def visualize_board(self):
+        '''
+        Visualize the board.
+
+        :return: None
+        '''
+        board = self.board
+
+        print('-' * len(board) * 2)
+        for i in range(len(board)):
+            for j in range(len(board)):
+                if board[i][j] == 0:
+                    print(' ', end=' ')
+                elif board[i][j] == 1:
+                    print('X', end=' ')
+                else:
+                    print('O', end=' ')
+            print()
+        print('-' * len(board) * 2)
+
+    def game_end(self, piece_type, action="MOVE"):
+        '''
+        Check if the game should end.
+
+        :param piece_type: 1('X') or 2('O').
+        :param action: "MOVE" or "PASS".
+        :return: boolean indicating whether the game should end.
+        '''
+
+        # Case 1: max move reached
+        if self.n_move >= self.max_move:
+            return True
+        # Case 2: two players all pass the move.
+        if self.compare_board(self.previous_board, self.board) and action == "PASS":
+            return True
+        return False
+
+    def score(self, piece_type):
+        '''
+        Get score of a player by counting the number of stones.
+
+        :param piece_type: 1('X') or 2('O').
+        :return: boolean indicating whether the game should end.
+        '''
+
+        board = self.board
+        cnt = 0
+        for i in range(self.size):
+            for j in range(self.size):
+                if board[i][j] == piece_type:
+                    cnt += 1
+        return cnt          
+
+    def judge_winner(self):
+        '''
+        Judge the winner of the game by number of pieces for each player.
+
+        :param: None.
+        :return: piece type of winner of the game (0 if it's a tie).
+        '''        
+
+        cnt_1 = self.score(1)
+        cnt_2 = self.score(2)
+        if cnt_1 > cnt_2 + self.komi: return 1
+        elif cnt_1 < cnt_2 + self.komi: return 2
+        else: return 0
+        
+    def play(self, player1, player2, verbose=False):
+        '''
+        The game starts!
+
+        :param player1: Player instance.
+        :param player2: Player instance.
+        :param verbose: whether print input hint and error information
+        :return: piece type of winner of the game (0 if it's a tie).
+        '''
+        self.init_board(self.size)
+        # Print input hints and error message if there is a manual player
+        if player1.type == 'manual' or player2.type == 'manual':
+            self.verbose = True
+            print('----------Input "exit" to exit the program----------')
+            print('X stands for black chess, O stands for white chess.')
+            self.visualize_board()
+        
+        verbose = self.verbose
+        # Game starts!
+        while 1:
+            piece_type = 1 if self.X_move else 2
+
+            # Judge if the game should end
+            if self.game_end(piece_type):       
+                result = self.judge_winner()
+                if verbose:
+                    print('Game ended.')
+                    if result == 0: 
+                        print('The game is a tie.')
+                    else: 
+                        print('The winner is {}'.format('X' if result == 1 else 'O'))
+                return result
+
+            if verbose:
+                player = "X" if piece_type == 1 else "O"
+                print(player + " makes move...")
+
+            # Game continues
+            if piece_type == 1: action = player1.get_input(self, piece_type)
+            else: action = player2.get_input(self, piece_type)
+
+            if verbose:
+                player = "X" if piece_type == 1 else "O"
+                print(action)
+
+            if action != "PASS":
+                # If invalid input, continue the loop. Else it places a chess on the board.
+                if not self.place_chess(action[0], action[1], piece_type):
+                    if verbose:
+                        self.visualize_board() 
+                    continue
+
+                self.died_pieces = self.remove_died_pieces(3 - piece_type) # Remove the dead pieces of opponent
+            else:
+                self.previous_board = [row[:] for row in self.board]
+
+            if verbose:
+                self.visualize_board() # Visualize the board again
+                print()
+
+            self.n_move += 1
+            self.X_move = not self.X_move # Players take turn
+
+class MyPlayer():
+    def __init__(self, weights=None):
+        '''
+        :param weights: dict overriding some of DEFAULT_HEURISTIC_WEIGHTS.
+        '''
+        self.type = 'my_player'
+        self.weights = dict(DEFAULT_HEURISTIC_WEIGHTS)
+        if weights is not None:
+            self.weights.update(weights)
+        self.time_limit_in_milli = MAX_TIME_FOR_EACH_MOVE_IN_MILLI
+        self.safety_margin_in_milli = SEARCH_SAFETY_MARGIN_IN_MILLI
+        self.state_path = None # File keeping the turn number between processes, in-process games use go.n_move
+        self.transposition_table = {} # board code -> (depth, placement) restored from the previous move
+        self.on_search_start = None # Called with no argument right before the search, used by bench_startup.py
+        self.start_time = None # Time the move started, defaults to when get_input is called
+        self.output_path = None # Where the best move so far is written during the search
+        self.book_path = None # Opening book consulted before searching, off for in-process games
+        self.tracer = None # SearchTracer recording every visited node, off by default
+        self.pv_table = [] # Triangular principal variation table, row ply holds the moves from ply on
+        self.pv_length = []
+        self.deadline_hit = False # Whether a node of the current iteration returned early because of the deadline
+
+    def calculate_heuristic(self, go, piece_type, placement, turn_left):
+        
+        weights = self.weights
+        another_piece_type = 3 - piece_type
+        go.remove_died_pieces(another_piece_type)
+        
+        list_my_stone = []
+        list_opponent_stone = []
+        count_my_stone = 0 
+        count_opponent_stone = 0
+
+        for i in range(go.size):
+            for j in range(go.size):
+                if go.board[i][j] == piece_type: 
+                    count_my_stone += 1
+                    list_my_stone.append((i,j))
+                elif go.board[i][j] == another_piece_type: 
+                    count_opponent_stone += 1
+                    list_opponent_stone.append((i,j))
+        
+        #Heuristic1 Different Number of stones
+        diff_count_stone = count_my_stone - count_opponent_stone
+        blank = go.size - count_my_stone - count_opponent_stone
+        #estimate_turn_left = self.estimate_num_turn_left(go, blank, count_my_stone, count_opponent_stone)
+        estimate_turn_left = turn_left
+
+        list_my_stone_group_by_neighbor_and_liberty = []
+        while list_my_stone:
+            one_my_stone = list_my_stone[0]
+            ally_members, liberty = go.find_num_liberty_and_ally_member(one_my_stone[0], one_my_stone[1])
+            list_my_stone_group_by_neighbor_and_liberty.append((ally_members, liberty))
+            list_my_stone = [item for item in list_my_stone if item not in ally_members]
+
+        list_opponent_stone_group_by_neighbor_and_liberty = []
+        while list_opponent_stone:
+            one_opponent_stone = list_opponent_stone[0]
+            ally_members, liberty = go.find_num_liberty_and_ally_member(one_opponent_stone[0], one_opponent_stone[1])
+            list_opponent_stone_group_by_neighbor_and_liberty.append((ally_members, liberty))
+            list_opponent_stone = [item for item in list_opponent_stone if item not in ally_members]
+
+        heulistic_case_1 = 0
+        max_int_for_calculate_heulistic = MAX_INT_IN_THIS_PROGRAM / 1000
+        # if black
+        if piece_type == 1: 
+            if diff_count_stone > go.size / 2:
+                heulistic_case_1 += max_int_for_calculate_heulistic
+            else: 
+                heulistic_case_1 -= max_int_for_calculate_heulistic
+        # if white
+        elif piece_type == 2:
+            if diff_count_stone > -1 * (go.size / 2):
+                heulistic_case_1 += max_int_for_calculate_heulistic
+            else:
+                heulistic_case_1 -= max_int_for_calculate_heulistic
+
+        heulistic_case_1 += diff_count_stone * weights['stone_difference']        
+        if estimate_turn_left <= (go.size * go.size) / 2:
+            heulistic_case_1 = heulistic_case_1 * 10
+
+        heulistic_case_2 = 0
+        #heuristic plus for my liberty
+        for group in list_my_stone_group_by_neighbor_and_liberty:
+            list_stone_group = group[0]
+            liberty = group[1]
+            num_of_list_stone = len(list_stone_group)
+            fix_constant = 0
+            if num_of_list_stone <= 1:
+                fix_constant += weights['my_group_small']
+            elif num_of_list_stone > 1 and num_of_list_stone <= 3:
+                fix_constant += weights['my_group_medium']
+            elif num_of_list_stone > 3:
+                fix_constant += weights['my_group_large']
+            heulistic_case_2 += fix_constant * num_of_list_stone * liberty
+            if liberty == 1:
+                heulistic_case_2 += weights['my_liberty_1'] * num_of_list_stone
+            if liberty == 2:
+                heulistic_case_2 += weights['my_liberty_2'] * num_of_list_stone
+            if liberty == 3:
+                heulistic_case_2 += weights['my_liberty_3'] * num_of_list_stone
+        # #heuristic minus for opponent liberty
+        for group in list_opponent_stone_group_by_neighbor_and_liberty:
+            list_stone_group = group[0]
+            liberty = group[1]
+            num_of_list_stone = len(list_stone_group)
+            fix_constant = 0
+            if num_of_list_stone <= 1:
+                fix_constant += weights['opponent_group_small']
+            elif num_of_list_stone > 1 and num_of_list_stone <= 3:
+                fix_constant += weights['opponent_group_medium']
+            elif num_of_list_stone > 3:
+                fix_constant += weights['opponent_group_large']
+            heulistic_case_2 += -1 * fix_constant * num_of_list_stone * liberty
+            if liberty == 1:
+                heulistic_case_2 += weights['opponent_liberty_1'] * num_of_list_stone
+            if liberty == 2:
+                heulistic_case_2 += weights['opponent_liberty_2'] * num_of_list_stone
+            if liberty == 3:
+                heulistic_case_2 += weights['opponent_liberty_3'] * num_of_list_stone
+
+        heulistic_case_2 = heulistic_case_2 * estimate_turn_left
+
+        heulistic_case_3 = 0
+        middle = (go.size - 1) / 2
+        if  count_my_stone + count_opponent_stone < go.size:
+            if placement == (middle, middle):
+                heulistic_case_3 += 1000000
+            elif placement == (middle - 1, middle - 1):
+                heulistic_case_3 += 100000
+            elif placement == (middle + 1, middle - 1):
+                heulistic_case_3 += 100000
+            elif placement == (middle - 1, middle + 1):
+                heulistic_case_3 += 100000
+            elif placement == (middle + 1, middle + 1):
+                heulistic_case_3 += 100000
+        i = placement[0]
+        j = placement[1]
+        divider = abs(middle - i) + abs(middle - j)
+        if divider <= 0:
+            divider = 1
+        heulistic_case_3 += weights['center_distance'] / divider
+        return heulistic_case_1 + heulistic_case_2 + heulistic_case_3
+
+    def find_possible_placements_and_number_of_blank(self, go, piece_type):
+        possible_placements = []
+        blank = 0
+        num_piece_type = 0
+        num_another_piece_type = 0
+        another_piece_type = 3 - piece_type
+        for i in range(go.size):
+            for j in range(go.size):
+                if go.board[i][j] == 0:
+                    blank += 1
+                elif go.board[i][j] == piece_type:
+                    num_piece_type += 1
+                elif go.board[i][j] == another_piece_type:
+                    num_another_piece_type += 1
+                if go.valid_place_check(i, j, piece_type, test_check = True):
+                    possible_placements.append((i, j))
+        middle = (go.size - 1) / 2
+        if possible_placements:
+            possible_placements.sort(key = lambda x:  abs(middle - x[0]) + abs(middle - x[1]))
+        return (possible_placements, (blank, num_piece_type, num_another_piece_type))
+
+    def get_input(self, go, piece_type):
+        '''
+        Get one input.
+
+        :param go: Go instance.
+        :param piece_type: 1('X') or 2('O').
+        :return: (row, column) coordinate of input.
+        '''     
+        possible_placements, tuple_stone = self.find_possible_placements_and_number_of_blank(go, piece_type)
+        max_depth, num_turn = self.restore_state(go, tuple_stone)
+        if not possible_placements:
+            # A PASS is still a turn, the next move must not start behind
+            self.save_state(go, piece_type, num_turn + 2, [])
+            return "PASS"
+
+        start_time = self.start_time
+        if start_time is None:
+            start_time = getTimeNowInMilli()
+        end_time = start_time + self.time_limit_in_milli - self.safety_margin_in_milli
+
+        # The book ignores the KO rule, possible_placements rejects a book move it forbids
+        if self.book_path is not None:
+            book_placement = lookupOpeningBook(go, piece_type, self.book_path)
+            if book_placement in possible_placements:
+                print(f'book_move: {book_placement}')
+                self.save_state(go, piece_type, num_turn + 2, [book_placement])
+                return book_placement
+
+        print(f'max depth : {max_depth}')
+        # Search the move the previous search expected here first, it sets a good alpha for the others
+        entry = self.transposition_table.get(encodeBoard(go.board, go.size))
+        if entry is not None and entry[1] in possible_placements:
+            possible_placements.remove(entry[1])
+            possible_placements.insert(0, entry[1])
+        # Always have a move and the next turn on disk before searching in case the deadline hits first
+        def on_depth_completed(placement, move_path):
+            self.write_best_placement(placement)
+            self.save_state(go, piece_type, num_turn + 2, move_path)
+        on_depth_completed(possible_placements[0], [possible_placements[0]])
+        if self.on_search_start is not None:
+            self.on_search_start()
+        best_placement, max_heuristic, best_move_path = self.search_placements(go, piece_type, possible_placements, max_depth, end_time, on_depth_completed)
+            
+        print(f'best_move: {best_placement}')
+        print(f'best_move_path: {best_move_path}')
+        print(f'max_heuristic: {max_heuristic}')
+
+        if not possible_placements:
+            return "PASS"
+        # elif placements_with_heuristic[0][1] < 0:
+        #     return "PASS"
+        else:
+            self.save_state(go, piece_type, num_turn + 2, best_move_path)
+            return best_placement
+
+    def restore_state(self, go, tuple_stone):
+        '''
+        Restore the turn number and the best moves saved by the previous move.
+
+        :param go: Go instance.
+        :param tuple_stone: tuple of number of blanks, own stones and opponent stones.
+        :return: tuple of max depth and turn number.
+        '''
+        num_blank_space = tuple_stone[0]
+        num_piece_type = tuple_stone[1]
+        num_another_piece_type = tuple_stone[2]
+
+        if self.state_path is None:
+            num_turn = go.n_move
+            return (go.size ** 2) - num_turn - 2, num_turn
+
+        # The first move of each player starts a new game, ignore the state of the last one
+        num_stone = num_piece_type + num_another_piece_type
+        if num_stone <= 1:
+            return (go.size ** 2) - num_stone - 2, num_stone
+
+        state = readPlayerState(go.size, self.state_path)
+        if state is None:
+            print('no player state, estimating the turn')
+            max_depth = self.estimate_num_turn_left(go, num_blank_space, num_piece_type, num_another_piece_type)
+            return max_depth, num_stone
+        num_turn, self.transposition_table = state
+        return (go.size ** 2) - num_turn - 2, num_turn
+
+    def save_state(self, go, piece_type, num_turn, move_path):
+        '''
+        Save the turn number of our next move and our best moves along the principal variation for the next process.
+
+        :param go: Go instance before our move.
+        :param piece_type: 1('X') or 2('O').
+        :param num_turn: turn number of our next move.
+        :param move_path: principal variation starting with our move.
+        :return: None.
+        '''
+        if self.state_path is None:
+            return
+        transposition_table = {}
+        go_along_path = go.copy_board()
+        moving_piece_type = piece_type
+        for index, placement in enumerate(move_path):
+            if moving_piece_type == piece_type:
+                transposition_table[encodeBoard(go_along_path.board, go.size)] = (len(move_path) - index, placement)
+            go_along_path.board[placement[0]][placement[1]] = moving_piece_type
+            go_along_path.remove_died_pieces(3 - moving_piece_type)
+            moving_piece_type = 3 - moving_piece_type
+        writePlayerState(go.size, num_turn, transposition_table, self.state_path)
+
+    def search_placements(self, go, piece_type, possible_placements, max_depth, end_time, on_depth_completed=None):
+        '''
+        Run an iterative deepening search over all possible placements, one depth at a time.
+        Only the result of a fully searched depth is kept.
+
+        :param go: Go instance.
+        :param piece_type: 1('X') or 2('O').
+        :param possible_placements: list of valid (row, column) placements.
+        :param max_depth: deepest depth searched below each placement.
+        :param end_time: time in milliseconds when the search must stop.
+        :param on_depth_completed: called with the best placement and move path after each completed depth.
+        :return: tuple of best placement, its heuristic and the best move path.
+        '''
+        another_piece_type = 3 - piece_type
+        list_go_with_placement = []
+        for placement in possible_placements:
+            go_with_placement = go.copy_board()
+            go_with_placement.board[placement[0]][placement[1]] = piece_type
+            go_with_placement.remove_died_pieces(another_piece_type)
+            list_go_with_placement.append((placement, go_with_placement))
+
+        max_ply = max_depth + 2
+        self.pv_table = [[None] * max_ply for ply in range(max_ply)]
+        self.pv_length = [0] * max_ply
+
+        best_placement = possible_placements[0]
+        max_heuristic = MIN_INT_IN_THIS_PROGRAM
+        best_move_path = [best_placement]
+        self.deadline_hit = False
+        depth = 0
+        if self.tracer is not None:
+            self.tracer.start_search(go.board, max_depth)
+        while depth <= max_depth and getTimeNowInMilli() < end_time:
+            depth_placement = possible_placements[0]
+            depth_heuristic = MIN_INT_IN_THIS_PROGRAM
+            depth_move_path = [depth_placement]
+            self.pv_length[0] = 0
+            for placement, go_with_placement in list_go_with_placement:
+                # A placement can only replace the best one by beating it, so the best heuristic is a valid alpha
+                temp_heuristic = self.min(go_with_placement, piece_type, placement, depth, depth_heuristic, MAX_INT_IN_THIS_PROGRAM, 1, end_time, max_depth)
+                if temp_heuristic > depth_heuristic:
+                    depth_heuristic = temp_heuristic
+                    depth_placement = placement
+                    self.update_pv(0, placement)
+                    depth_move_path = self.pv_table[0][:self.pv_length[0]]
+            if getTimeNowInMilli() >= end_time:
+                self.deadline_hit = True
+            # The placements are searched at depth, so the root itself is one deeper
+            self.trace_node(go, 0, depth + 1, MIN_INT_IN_THIS_PROGRAM, MAX_INT_IN_THIS_PROGRAM, depth_heuristic, False)
+            if self.deadline_hit:
+                break
+            best_placement = depth_placement
+            max_heuristic = depth_heuristic
+            best_move_path = depth_move_path
+            if on_depth_completed is not None:
+                on_depth_completed(best_placement, best_move_path)
+            depth += 1
+        return best_placement, max_heuristic, best_move_path
+
+    def write_best_placement(self, placement):
+        '''
+        Write the best placement found so far to the output file, if there is one.
+
+        :param placement: (row, column) of the placement.
+        :return: None.
+        '''
+        if self.output_path is not None:
+            writeOutput(placement, self.output_path)
+
+    def estimate_num_turn_left(self, go, num_blank_space, num_piece_type, num_another_piece_type):
+        
+        all_possible_num = go.size ** 2
+        max_stone = 0
+        if num_piece_type >= num_another_piece_type:
+            max_stone = num_piece_type
+        else:
+            max_stone = num_another_piece_type
+        max_stone = max_stone * 2
+        all_possible_num = all_possible_num - max_stone - 1
+         #adjust_max_depth
+        if all_possible_num <= 8 and all_possible_num > 6:
+             all_possible_num = all_possible_num - 4
+        elif all_possible_num <= 6 and all_possible_num > 3:
+            all_possible_num = all_possible_num - 2
+        elif all_possible_num <= 3:
+            all_possible_num = 1
+        return all_possible_num
+
+    def max(self, go, piece_type, outest_placement, depth, alpha, beta, ply, end_time, max_depth):
+        another_piece_type = 3 - piece_type
+        window_alpha = alpha
+        self.pv_length[ply] = ply
+        now = getTimeNowInMilli()
+        if depth == 0 or now >= end_time:
+            if depth > 0:
+                self.deadline_hit = True
+            heuristic = self.calculate_heuristic(go, piece_type, outest_placement, max_depth)
+            self.trace_node(go, ply, depth, window_alpha, beta, heuristic, False)
+            return heuristic
+        possible_placements, tuple_stone = self.find_possible_placements_and_number_of_blank(go, piece_type)
+        heuristic = MIN_INT_IN_THIS_PROGRAM
+        if not possible_placements: 
+            heuristic = self.calculate_heuristic(go, piece_type, outest_placement, max_depth)
+            self.trace_node(go, ply, depth, window_alpha, beta, heuristic, False)
+            return heuristic
+        for placement in possible_placements:
+            go_with_placement = go.copy_board()
+            go_with_placement.board[placement[0]][placement[1]] = piece_type
+            go_with_placement.remove_died_pieces(another_piece_type)
+            temp_heuristic = self.min(go_with_placement, piece_type, outest_placement, depth - 1, alpha, beta, ply + 1, end_time, max_depth + 1)
+            if temp_heuristic > heuristic:
+                heuristic = temp_heuristic
+                self.update_pv(ply, placement)
+            if heuristic >= beta: 
+                self.trace_node(go, ply, depth, window_alpha, beta, heuristic, True)
+                return heuristic
+            alpha = max(alpha, heuristic)
+        self.trace_node(go, ply, depth, window_alpha, beta, heuristic, False)
+        return heuristic
+
+    def min(self, go, piece_type, outest_placement, depth, alpha, beta, ply, end_time, max_depth):
+        window_beta = beta
+        self.pv_length[ply] = ply
+        now = getTimeNowInMilli()
+        if depth == 0 or now >= end_time:
+            if depth > 0:
+                self.deadline_hit = True
+            heuristic = self.calculate_heuristic(go, piece_type, outest_placement, max_depth)
+            self.trace_node(go, ply, depth, alpha, window_beta, heuristic, False)
+            return heuristic
+        another_piece_type = 3 - piece_type
+        possible_placements, tuple_stone = self.find_possible_placements_and_number_of_blank(go, another_piece_type)
+        heuristic = MAX_INT_IN_THIS_PROGRAM
+        if not possible_placements: 
+            heuristic = self.calculate_heuristic(go, piece_type, outest_placement, max_depth)
+            self.trace_node(go, ply, depth, alpha, window_beta, heuristic, False)
+            return heuristic
+        for placement in possible_placements:
+            go_with_placement = go.copy_board()
+            go_with_placement.board[placement[0]][placement[1]] = another_piece_type
+            go_with_placement.remove_died_pieces(piece_type)
+            temp_heuristic = self.max(go_with_placement, piece_type, outest_placement, depth - 1, alpha, beta, ply + 1, end_time, max_depth + 1)
+            if temp_heuristic < heuristic:
+                heuristic = temp_heuristic
+                self.update_pv(ply, placement)
+            if heuristic <= alpha:
+                self.trace_node(go, ply, depth, alpha, window_beta, heuristic, True)
+                return heuristic
+            beta = min(beta, heuristic)
+        self.trace_node(go, ply, depth, alpha, window_beta, heuristic, False)
+        return heuristic
+
+    def update_pv(self, ply, placement):
+        '''
+        Make placement followed by the principal variation of the next ply the principal variation of this ply.
+
+        :param ply: number of moves from the root.
+        :param placement: (row, column) of the new best placement.
+        :return: None.
+        '''
+        pv_row = self.pv_table[ply]
+        child_length = self.pv_length[ply + 1]
+        pv_row[ply] = placement
+        pv_row[ply + 1:child_length] = self.pv_table[ply + 1][ply + 1:child_length]
+        self.pv_length[ply] = child_length
+
+    def trace_node(self, go, ply, depth, alpha, beta, heuristic, cutoff):
+        '''
+        Record a finished node to the search trace, if tracing is on.
+        Once the deadline has cut a node short, every node finishing after it is recorded as aborted.
+
+        :return: None.
+        '''
+        if self.tracer is None:
+            return
+        best_placement = self.pv_table[ply][ply] if self.pv_length[ply] > ply else None
+        if self.deadline_hit:
+            flag = SEARCH_TRACE_ABORTED
+        elif cutoff:
+            flag = SEARCH_TRACE_CUTOFF
+        else:
+            flag = 0
+        self.tracer.record(go.board, ply, depth, alpha, beta, heuristic, best_placement, flag)
+        
+def readInput(n, path="input.txt"):
+    with open(path, 'r') as f:
+        lines = f.read().split()
+
+    piece_type = int(lines[0])
+
+    previous_board = [[int(x) for x in line] for line in lines[1:n+1]]
+    board = [[int(x) for x in line] for line in lines[n+1: 2*n+1]]
+
+    return piece_type, previous_board, board
+
+def writeOutput(result, path="output.txt"):
+    res = ""
+    if result == "PASS":
+        res = "PASS"
+    else:
+        res += str(result[0]) + ',' + str(result[1])
+
+    # Write to a temporary file first so the referee never reads a partial move
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w') as f:
+        f.write(res)
+    os.replace(temp_path, path)
+
+def writePass(path="output.txt"):
+	writeOutput("PASS", path)
+
+def readPlayerState(n, path=PLAYER_STATE_PATH):
+    '''
+    Read the state saved by the previous move through a memory map.
+
+    :param n: size of the board n*n.
+    :param path: state file.
+    :return: tuple of turn number and transposition table, or None if there is no valid state.
+    '''
+    try:
+        f = open(path, 'rb')
+    except OSError:
+        return None
+    with f:
+        try:
+            state = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None
+        with state:
+            if len(state) < PLAYER_STATE_HEADER.size:
+                return None
+            magic, size, turn, num_entries = PLAYER_STATE_HEADER.unpack_from(state, 0)
+            offset = PLAYER_STATE_HEADER.size
+            if magic != PLAYER_STATE_MAGIC or size != n or len(state) < offset + num_entries * PLAYER_STATE_ENTRY.size:
+                return None
+            transposition_table = {}
+            for code, depth, move in PLAYER_STATE_ENTRY.iter_unpack(state[offset:offset + num_entries * PLAYER_STATE_ENTRY.size]):
+                transposition_table[code] = (depth, divmod(move, n))
+    return turn, transposition_table
+
+def writePlayerState(n, turn, transposition_table, path=PLAYER_STATE_PATH):
+    '''
+    Save the state for the next move.
+
+    :param n: size of the board n*n.
+    :param turn: turn number of our next move.
+    :param transposition_table: dict of board code -> (depth, placement).
+    :param path: state file.
+    :return: None.
+    '''
+    state = bytearray(PLAYER_STATE_HEADER.pack(PLAYER_STATE_MAGIC, n, turn, len(transposition_table)))
+    for code, (depth, placement) in transposition_table.items():
+        state += PLAYER_STATE_ENTRY.pack(code, depth, placement[0] * n + placement[1])
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(state)
+    os.replace(temp_path, path)
+
+def getNeighborTable(n):
+    '''
+    :param n: size of the board n*n.
+    :return: table of the neighbors (row, column) of every point, indexed by row and column.
+    '''
+    if n not in NEIGHBOR_TABLES:
+        table = []
+        for i in range(n):
+            row = []
+            for j in range(n):
+                neighbors = []
+                # Detect borders and add neighbor coordinates
+                if i > 0: neighbors.append((i-1, j))
+                if i < n - 1: neighbors.append((i+1, j))
+                if j > 0: neighbors.append((i, j-1))
+                if j < n - 1: neighbors.append((i, j+1))
+                row.append(neighbors)
+            table.append(row)
+        NEIGHBOR_TABLES[n] = table
+    return NEIGHBOR_TABLES[n]
+
+def getSymmetryPowerTable(n):
+    '''
+    :param n: size of the board n*n.
+    :return: for each symmetry, the power of 3 of every point (row * n + column) on the transformed board.
+    '''
+    if n not in SYMMETRY_POWER_TABLES:
+        table = []
+        for symmetry in range(8):
+            powers = []
+            for i in range(n):
+                for j in range(n):
+                    ti, tj = transformPoint(i, j, n, symmetry)
+                    powers.append(3 ** (ti * n + tj))
+            table.append(powers)
+        SYMMETRY_POWER_TABLES[n] = table
+    return SYMMETRY_POWER_TABLES[n]
+
+class SearchTracer():
+    def __init__(self, path, size):
+        '''
+        Append-only binary log of the nodes visited by the search, read back by read_search_trace.py.
+        Nodes are written when they finish, so every node follows its children.
+
+        :param path: trace file, a header is written if it is empty.
+        :param size: size of the board n*n.
+        '''
+        self.size = size
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(SEARCH_TRACE_HEADER.pack(SEARCH_TRACE_MAGIC, size))
+        self.buffer = bytearray()
+
+    def record(self, board, ply, depth, alpha, beta, heuristic, placement, flag):
+        '''
+        Record one finished node.
+
+        :param board: board state of the node.
+        :param ply: number of moves from the root.
+        :param depth: remaining depth of the node.
+        :param alpha: alpha the node was searched with.
+        :param beta: beta the node was searched with.
+        :param heuristic: value returned by the node.
+        :param placement: (row, column) of the best placement, or None.
+        :param flag: 0, SEARCH_TRACE_CUTOFF or SEARCH_TRACE_ABORTED.
+        :return: None.
+        '''
+        move = SEARCH_TRACE_NO_MOVE if placement is None else placement[0] * self.size + placement[1]
+        self.buffer += SEARCH_TRACE_RECORD.pack(encodeBoard(board, self.size), ply, depth, clampToInt(alpha), clampToInt(beta), clampToInt(heuristic), move, flag)
+        # Root records end a search iteration, flush them so a watchdog exit keeps whole iterations
+        if ply == 0 or len(self.buffer) >= 65536:
+            self.flush()
+
+    def start_search(self, board, max_depth):
+        '''
+        Mark the start of a new search, so the searches of different moves can be told apart.
+
+        :param board: board state of the root.
+        :param max_depth: deepest depth the search may reach.
+        :return: None.
+        '''
+        self.buffer += SEARCH_TRACE_RECORD.pack(encodeBoard(board, self.size), SEARCH_TRACE_NEW_SEARCH, max_depth, 0, 0, 0, SEARCH_TRACE_NO_MOVE, 0)
+
+    def flush(self):
+        self.file.write(self.buffer)
+        self.file.flush()
+        self.buffer = bytearray()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+def clampToInt(value):
+    return int(max(MIN_INT_IN_THIS_PROGRAM, min(MAX_INT_IN_THIS_PROGRAM, value)))
+
+def startWatchdog(deadline):
+    '''
+    End the process at a hard deadline. The best move found so far is already in the output file by then.
+
+    :param deadline: time in milliseconds when the process must end.
+    :return: None.
+    '''
+    # A zero delay would disable the timer
+    delay = max(1, deadline - getTimeNowInMilli()) / 1000
+    try:
+        # C half of signal, already loaded by CPython. signal itself imports enum and functools,
+        # about 5 ms of import time and 7 ms of process time measured with bench_startup.py's interpreter
+        import _signal as signal_module
+    except ImportError:
+        import signal as signal_module
+    if hasattr(signal_module, 'setitimer'):
+        signal_module.signal(signal_module.SIGALRM, lambda signum, frame: os._exit(0))
+        signal_module.setitimer(signal_module.ITIMER_REAL, delay)
+    else:
+        import threading
+        watchdog = threading.Timer(delay, os._exit, args=(0,))
+        watchdog.daemon = True
+        watchdog.start()
+
+def transformPoint(i, j, n, symmetry):
+    '''
+    Map a point through one of the 8 symmetries of the board.
+
+    :param symmetry: 0-7, bit 4 transposes, bit 1 flips rows and bit 2 flips columns.
+    :return: transformed (row, column).
+    '''
+    if symmetry & 4:
+        i, j = j, i
+    if symmetry & 1:
+        i = n - 1 - i
+    if symmetry & 2:
+        j = n - 1 - j
+    return i, j
+
+def encodeBoard(board, n, symmetry=0):
+    '''
+    Encode a board as a base-3 integer after applying a symmetry.
+
+    :return: integer code of the transformed board.
+    '''
+    powers = getSymmetryPowerTable(n)[symmetry]
+    code = 0
+    index = 0
+    for row in board:
+        for x in row:
+            if x:
+                code += x * powers[index]
+            index += 1
+    return code
+
+def canonicalizeBoard(board, n):
+    '''
+    Find the smallest code among the 8 symmetric versions of a board.
+
+    :return: tuple of canonical code and the symmetry producing it.
+    '''
+    best_code = None
+    best_symmetry = 0
+    for symmetry in range(8):
+        code = encodeBoard(board, n, symmetry)
+        if best_code is None or code < best_code:
+            best_code = code
+            best_symmetry = symmetry
+    return best_code, best_symmetry
+
+def lookupOpeningBook(go, piece_type, path=OPENING_BOOK_PATH):
+    '''
+    Look the current position up in the opening book with a binary search over the memory-mapped file.
+
+    :param go: Go instance.
+    :param piece_type: 1('X') or 2('O').
+    :return: (row, column) of the book move, or None if the position is not in the book.
+    '''
+    try:
+        f = open(path, 'rb')
+    except OSError:
+        return None
+    with f:
+        try:
+            book = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None
+        with book:
+            if len(book) < OPENING_BOOK_HEADER.size:
+                return None
+            magic, size, max_stones, count = OPENING_BOOK_HEADER.unpack_from(book, 0)
+            if magic != OPENING_BOOK_MAGIC or size != go.size:
+                return None
+            if go.score(1) + go.score(2) > max_stones:
+                return None
+
+            code, symmetry = canonicalizeBoard(go.board, go.size)
+            key = code * 4 + piece_type
+            low = 0
+            high = count
+            while low < high:
+                mid = (low + high) // 2
+                entry = OPENING_BOOK_ENTRY.unpack_from(book, OPENING_BOOK_HEADER.size + mid * OPENING_BOOK_ENTRY.size)[0]
+                if entry >> 8 < key:
+                    low = mid + 1
+                else:
+                    high = mid
+            if low >= count:
+                return None
+            entry = OPENING_BOOK_ENTRY.unpack_from(book, OPENING_BOOK_HEADER.size + low * OPENING_BOOK_ENTRY.size)[0]
+            if entry >> 8 != key:
+                return None
+
+    # The book move is stored on the canonical board, map it back to this one
+    canonical_move = divmod(entry & 0xFF, go.size)
+    for i in range(go.size):
+        for j in range(go.size):
+            if transformPoint(i, j, go.size, symmetry) == canonical_move:
+                return (i, j)
+    return None
+
+def main():
+    '''
+    Play one move from input.txt to output.txt. The referee runs this through my_player3.py.
+
+    :return: None.
+    '''
+    N = 5
+    piece_type, previous_board, board = readInput(N)
+    go = GO(N)
+    go.set_board(piece_type, previous_board, board)
+    go.visualize_board()
+    print("--------------------")
+    player = MyPlayer()
+    player.start_time = START_TIME
+    player.output_path = "output.txt"
+    player.book_path = OPENING_BOOK_PATH
+    player.state_path = PLAYER_STATE_PATH
+    if os.environ.get("STARTUP_PROBE"):
+        def exit_at_search_start():
+            print(f'first_node_time: {time.time() * 1000:.3f}', flush=True)
+            os._exit(0)
+        player.on_search_start = exit_at_search_start
+    if os.environ.get("SEARCH_TRACE_PATH"):
+        player.tracer = SearchTracer(os.environ["SEARCH_TRACE_PATH"], N)
+    startWatchdog(START_TIME + MAX_TIME_FOR_EACH_MOVE_IN_MILLI - WATCHDOG_SAFETY_MARGIN_IN_MILLI)
+    action = player.get_input(go, piece_type)
+    if player.tracer is not None:
+        player.tracer.close()
+    if action != "PASS":
+        go.place_chess(action[0], action[1], piece_type)
+    go.visualize_board()
+    writeOutput(action)
\ No newline at end of file
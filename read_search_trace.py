@@ -0,0 +1,145 @@
+'''
+Rebuild and summarize the search tree recorded by my_player3.py.
+
+Record a trace by setting SEARCH_TRACE_PATH when running the player:
+
+    SEARCH_TRACE_PATH=trace.bin python my_player3.py
+
+Every move appends one search to the trace, made of one tree per iteration
+of the iterative deepening. The root of an iteration has depth d + 1 when
+its placements were searched to depth d. Nodes the deadline cut short are
+flagged as aborted, and an iteration whose root is aborted was discarded by
+the player, so it is reported as incomplete without a best move or PV.
+
+Usage: python read_search_trace.py trace.bin [--tree PLY]
+'''
+import argparse
+from collections import namedtuple
+
+from go_player import SEARCH_TRACE_MAGIC, SEARCH_TRACE_HEADER, SEARCH_TRACE_RECORD, SEARCH_TRACE_NO_MOVE, SEARCH_TRACE_NEW_SEARCH
+from go_player import SEARCH_TRACE_CUTOFF, SEARCH_TRACE_ABORTED
+
+TraceRecord = namedtuple('TraceRecord', ['code', 'ply', 'depth', 'alpha', 'beta', 'heuristic', 'move', 'flag'])
+
+class TraceNode():
+    def __init__(self, record, children):
+        self.record = record
+        self.children = children
+
+def readTrace(path):
+    '''
+    Read every record of a trace file.
+
+    :param path: trace file.
+    :return: tuple of board size and list of TraceRecord.
+    '''
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < SEARCH_TRACE_HEADER.size:
+        raise ValueError(f'{path} is not a search trace')
+    magic, size = SEARCH_TRACE_HEADER.unpack_from(data, 0)
+    if magic != SEARCH_TRACE_MAGIC:
+        raise ValueError(f'{path} is not a search trace')
+    body = data[SEARCH_TRACE_HEADER.size:]
+    # A process ended by the watchdog can leave a partial record at the end
+    body = body[:len(body) - len(body) % SEARCH_TRACE_RECORD.size]
+    records = [TraceRecord(*fields) for fields in SEARCH_TRACE_RECORD.iter_unpack(body)]
+    return size, records
+
+def buildTree(records):
+    '''
+    Rebuild the search trees from records written in post-order.
+
+    :param records: list of TraceRecord.
+    :return: list of searches, each a tuple of the search record and its root TraceNode, one for each iteration.
+    '''
+    searches = []
+    pending = {} # ply -> finished nodes still waiting for their parent
+    roots = []
+    for record in records:
+        if record.ply == SEARCH_TRACE_NEW_SEARCH:
+            # Nodes of an iteration cut short by the watchdog never get a root
+            pending = {}
+            roots = []
+            searches.append((record, roots))
+            continue
+        node = TraceNode(record, pending.pop(record.ply + 1, []))
+        if record.ply == 0:
+            roots.append(node)
+        else:
+            pending.setdefault(record.ply, []).append(node)
+    return searches
+
+def decodeMove(move, size):
+    if move == SEARCH_TRACE_NO_MOVE:
+        return None
+    return divmod(move, size)
+
+def countNodes(node, counts):
+    '''
+    Count nodes, cutoffs and aborted nodes of a tree by ply.
+
+    :param counts: dict of ply -> [nodes, cutoffs, aborted], updated in place.
+    :return: None.
+    '''
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        ply_counts = counts.setdefault(node.record.ply, [0, 0, 0])
+        ply_counts[0] += 1
+        ply_counts[1] += node.record.flag == SEARCH_TRACE_CUTOFF
+        ply_counts[2] += node.record.flag == SEARCH_TRACE_ABORTED
+        stack.extend(node.children)
+
+def principalVariation(node, size):
+    '''
+    Follow the best moves down the recorded tree.
+
+    :return: list of (row, column) placements.
+    '''
+    path = []
+    while node.record.move != SEARCH_TRACE_NO_MOVE:
+        path.append(decodeMove(node.record.move, size))
+        # Children are in search order and only a strictly better value replaces the best one
+        best = [child for child in node.children if child.record.heuristic == node.record.heuristic]
+        if not best:
+            break
+        node = best[0]
+    return path
+
+FLAG_LABELS = {SEARCH_TRACE_CUTOFF: ' cutoff', SEARCH_TRACE_ABORTED: ' aborted'}
+
+def printTree(node, size, max_ply, indent=0):
+    record = node.record
+    print(f'{"  " * indent}ply {record.ply} depth {record.depth} [{record.alpha}, {record.beta}] '
+          f'-> {record.heuristic} best {decodeMove(record.move, size)}{FLAG_LABELS.get(record.flag, "")} #{record.code}')
+    if record.ply < max_ply:
+        for child in node.children:
+            printTree(child, size, max_ply, indent + 1)
+
+def summarize(size, searches, tree_ply=None):
+    for search_index, (search, roots) in enumerate(searches):
+        print(f'search {search_index}: root #{search.code}, max depth {search.depth}, {len(roots)} iterations')
+        for index, root in enumerate(roots):
+            counts = {}
+            countNodes(root, counts)
+            total = sum(ply_counts[0] for ply_counts in counts.values())
+            if root.record.flag == SEARCH_TRACE_ABORTED:
+                print(f'  iteration {index}: depth {root.record.depth}, incomplete (cut by the deadline, discarded), {total} nodes')
+            else:
+                print(f'  iteration {index}: depth {root.record.depth}, best {decodeMove(root.record.move, size)}, '
+                      f'heuristic {root.record.heuristic}, {total} nodes')
+                print(f'    pv: {principalVariation(root, size)}')
+            for ply in sorted(counts):
+                nodes, cutoffs, aborted = counts[ply]
+                print(f'    ply {ply}: {nodes} nodes, {cutoffs} cutoffs ({100 * cutoffs / nodes:.1f}%), {aborted} aborted')
+            if tree_ply is not None:
+                printTree(root, size, tree_ply, 2)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Summarize a search trace written by my_player3.py.')
+    parser.add_argument('path', help='trace file')
+    parser.add_argument('--tree', type=int, default=None, metavar='PLY', help='also print the tree down to this ply')
+    args = parser.parse_args()
+    size, records = readTrace(args.path)
+    summarize(size, buildTree(records), args.tree)
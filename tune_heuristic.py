@@ -0,0 +1,155 @@
+'''
+Tune the weights of MyPlayer.calculate_heuristic with SPSA over self-play games.
+
+The weights are searched as a vector of log scale factors over
+DEFAULT_HEURISTIC_WEIGHTS, so every weight keeps its sign. Each iteration
+nudges every factor up or down by a random sign, plays the two perturbed
+players against each other with GO.play across a process pool (each opening
+played once with each color), and moves the vector toward the side that won.
+Progress is checkpointed after every iteration and a run resumes from its
+checkpoint.
+
+Usage: python tune_heuristic.py [--iterations N] [--games G] [--workers W] [--time MILLI] [--checkpoint PATH]
+'''
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+
+from go_player import GO, MyPlayer, DEFAULT_HEURISTIC_WEIGHTS, HEURISTIC_WEIGHT_NAMES, getTimeNowInMilli
+
+class RandomOpeningPlayer():
+    def __init__(self, player, num_random_moves, seed):
+        '''
+        Play random valid placements for the first moves of the game, then let another player take over.
+        Two instances with the same seed play the same opening.
+
+        :param player: player used after the opening.
+        :param num_random_moves: number of moves of the game played at random.
+        :param seed: random seed of the opening.
+        '''
+        self.type = player.type
+        self.player = player
+        self.num_random_moves = num_random_moves
+        self.random = random.Random(seed)
+
+    def get_input(self, go, piece_type):
+        if go.n_move < self.num_random_moves:
+            possible_placements = [(i, j) for i in range(go.size) for j in range(go.size) if go.valid_place_check(i, j, piece_type, test_check=True)]
+            if possible_placements:
+                return self.random.choice(possible_placements)
+        return self.player.get_input(go, piece_type)
+
+def weightsFromVector(theta):
+    '''
+    :param theta: list of log scale factors, in the order of HEURISTIC_WEIGHT_NAMES.
+    :return: dict of heuristic weights.
+    '''
+    return {name: DEFAULT_HEURISTIC_WEIGHTS[name] * math.exp(x) for name, x in zip(HEURISTIC_WEIGHT_NAMES, theta)}
+
+def silenceWorker():
+    # MyPlayer prints its search summary on every move
+    sys.stdout = open(os.devnull, 'w')
+
+def playGame(task):
+    '''
+    Play one game between two weight sets.
+
+    :param task: tuple of black weights, white weights, time limit in milliseconds, number of random moves and seed.
+    :return: piece type of winner of the game (0 if it's a tie).
+    '''
+    black_weights, white_weights, time_limit, num_random_moves, seed = task
+    players = []
+    for weights in (black_weights, white_weights):
+        player = MyPlayer(weights)
+        player.time_limit_in_milli = time_limit
+        player.safety_margin_in_milli = 0
+        players.append(RandomOpeningPlayer(player, num_random_moves, seed))
+    go = GO(5)
+    return go.play(players[0], players[1])
+
+def spsaStep(theta, iteration, pool, args):
+    '''
+    Run one SPSA iteration.
+
+    :param theta: current list of log scale factors.
+    :param iteration: iteration number, also seeds the perturbation so resumed runs are reproducible.
+    :param pool: multiprocessing Pool playing the games.
+    :param args: parsed command line arguments.
+    :return: tuple of the new theta and the result of the plus side in [-1, 1].
+    '''
+    rng = random.Random(args.seed * 1000003 + iteration)
+    c_k = args.c / (iteration + 1) ** 0.101
+    a_k = args.a / (iteration + 1 + args.stability) ** 0.602
+    delta = [rng.choice((-1, 1)) for x in theta]
+    plus_weights = weightsFromVector([x + c_k * d for x, d in zip(theta, delta)])
+    minus_weights = weightsFromVector([x - c_k * d for x, d in zip(theta, delta)])
+
+    tasks = []
+    for game in range(args.games // 2):
+        seed = rng.randrange(2 ** 31)
+        tasks.append((plus_weights, minus_weights, args.time, args.random_moves, seed))
+        tasks.append((minus_weights, plus_weights, args.time, args.random_moves, seed))
+    winners = pool.map(playGame, tasks)
+
+    result = 0
+    for index, winner in enumerate(winners):
+        plus_piece_type = 1 if index % 2 == 0 else 2
+        if winner == plus_piece_type:
+            result += 1
+        elif winner == 3 - plus_piece_type:
+            result -= 1
+    result /= len(winners)
+    theta = [x + a_k * result / (2 * c_k * d) for x, d in zip(theta, delta)]
+    return theta, result
+
+def loadCheckpoint(path):
+    if not os.path.exists(path):
+        return {'iteration': 0, 'theta': [0.0] * len(HEURISTIC_WEIGHT_NAMES), 'history': []}
+    with open(path, 'r') as f:
+        checkpoint = json.load(f)
+    if len(checkpoint['theta']) != len(HEURISTIC_WEIGHT_NAMES):
+        raise ValueError(f'{path} was written for different heuristic weights')
+    return checkpoint
+
+def saveCheckpoint(checkpoint, path):
+    checkpoint['weights'] = weightsFromVector(checkpoint['theta'])
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(temp_path, path)
+
+def tune(args):
+    checkpoint = loadCheckpoint(args.checkpoint)
+    if checkpoint['iteration']:
+        print(f'resuming from iteration {checkpoint["iteration"]}')
+    with multiprocessing.Pool(args.workers, initializer=silenceWorker) as pool:
+        while checkpoint['iteration'] < args.iterations:
+            iteration = checkpoint['iteration']
+            start = getTimeNowInMilli()
+            checkpoint['theta'], result = spsaStep(checkpoint['theta'], iteration, pool, args)
+            elapsed = (getTimeNowInMilli() - start) / 1000
+            checkpoint['iteration'] = iteration + 1
+            checkpoint['history'].append({'iteration': iteration, 'result': result, 'games': args.games // 2 * 2})
+            saveCheckpoint(checkpoint, args.checkpoint)
+            print(f'iteration {iteration}: plus result {result:+.3f}, {args.games // 2 * 2 / elapsed * 3600:.0f} games/hour')
+    for name, weight in weightsFromVector(checkpoint['theta']).items():
+        print(f'{name}: {weight:.1f}')
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Tune the heuristic weights of go_player.py with SPSA self-play.')
+    parser.add_argument('--iterations', type=int, default=200, help='total number of SPSA iterations')
+    parser.add_argument('--games', type=int, default=16, help='games per iteration, played in pairs with swapped colors')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='number of processes playing games')
+    parser.add_argument('--time', type=int, default=50, help='search time in milliseconds for each move')
+    parser.add_argument('--random-moves', type=int, default=2, help='random opening moves of each game')
+    parser.add_argument('--a', type=float, default=0.2, help='SPSA step size')
+    parser.add_argument('--c', type=float, default=0.2, help='SPSA perturbation size, in log scale')
+    parser.add_argument('--stability', type=float, default=10, help='SPSA stability constant A')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    parser.add_argument('--checkpoint', default='tune_checkpoint.json', help='checkpoint file, resumed if it exists')
+    args = parser.parse_args()
+    tune(args)